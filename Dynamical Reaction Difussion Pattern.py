@@ -1,70 +1,400 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.colors import Normalize
 import tkinter as tk
 from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import json
-from numba import jit
-
-@jit(nopython=True)
-def manual_roll(arr, shift, axis):
-    result = np.empty_like(arr)
-    if axis == 0:
-        if shift > 0:
-            result[shift:] = arr[:-shift]
-            result[:shift] = arr[-shift:]
-        else:
-            result[:shift] = arr[-shift:]
-            result[shift:] = arr[:-shift]
-    else:
-        if shift > 0:
-            result[:, shift:] = arr[:, :-shift]
-            result[:, :shift] = arr[:, -shift:]
-        else:
-            result[:, :shift] = arr[:, -shift:]
-            result[:, shift:] = arr[:, :-shift]
-    return result
-
-@jit(nopython=True)
-def laplacian_jit(Z):
-    return (
-        manual_roll(Z, 1, 0) +
-        manual_roll(Z, -1, 0) +
-        manual_roll(Z, 1, 1) +
-        manual_roll(Z, -1, 1) - 4 * Z
-    )
-
-@jit(nopython=True)
-def update_jit(U, V, Du, Dv, f, k):
-    Lu = laplacian_jit(U)
-    Lv = laplacian_jit(V)
-    uvv = U * V * V
-    U += (Du * Lu - uvv + f * (1 - U)) * 0.9
-    V += (Dv * Lv + uvv - (f + k) * V) * 0.9
-    U = np.clip(U, 0, 1)
-    V = np.clip(V, 0, 1)
-    return U, V
+import threading
+import time
+import inspect
+from numba import njit, prange, cuda, float32, get_num_threads
+try:
+    import scipy.fft as fft
+    FFT_WORKERS = {'workers': -1}
+except ImportError:
+    import numpy.fft as fft
+    FFT_WORKERS = {}
+
+CUDA_AVAILABLE = cuda.is_available()
+
+# 64x64 float32 tiles of U and V together fill about 32KB, roughly one L1 cache
+BI = 64
+BJ = 64
+# Row-strip height for the temporally blocked step_k, unless the grid must be split
+# more finely to give every worker a strip
+STRIP_ROWS = 128
+# Upper bound on sub-steps per published frame. Up to STRIP_ROWS // 8, step_k's
+# minimum strip height (4K) is no taller than step's BI-row tiles, so it can split a
+# grid across as many workers as step can, and the 2K-row halo stays within a
+# quarter of a full-height strip
+MAX_SUBSTEPS = STRIP_ROWS // 8
+GPU_BLOCK = 16
+# Grids larger than this are strided down before being handed to imshow
+DISPLAY_MAX = 512
+# From this size on the Laplacian is taken as a circular convolution via FFT
+FFT_MIN_SIZE = 512
+# Parameters must stay unchanged this long (seconds) before a specialised kernel is compiled
+SPECIALIZE_IDLE = 0.5
+SPECIALIZE_CACHE_SIZE = 8
+# Marks a parameter set with no specialised kernel entry (None means compiling it failed)
+MISSING = object()
+# Specialisation only pays for its compile time on grids at least this large
+SPECIALIZE_MIN_SIZE = 512
+# Grid size and sub-steps per frame for the parameter sweep thumbnails
+SWEEP_SIZE = 100
+SWEEP_SUBSTEPS = 10
+
+# float32 literals for the kernels; plain Python floats would promote the arithmetic to float64
+ZERO = np.float32(0.0)
+ONE = np.float32(1.0)
+FOUR = np.float32(4.0)
+DT = np.float32(0.9)
+
+@njit(inline='always', fastmath=True, error_model='numpy', cache=True)
+def gray_scott(u, v, Lu, Lv, Du, Dv, f, k):
+    uvv = u * v * v
+    nu = u + DT * (Du * Lu - uvv + f * (ONE - u))
+    nv = v + DT * (Dv * Lv + uvv - (f + k) * v)
+    # Clamp to [0, 1] in the store itself; compiles to min/max, not a separate pass
+    nu = ZERO if nu < ZERO else (ONE if nu > ONE else nu)
+    nv = ZERO if nv < ZERO else (ONE if nv > ONE else nv)
+    return nu, nv
+
+@njit(inline='always', cache=True)
+def strip_height(N, K, W):
+    # One strip per worker where the grid allows it, but at least 4K rows so the
+    # 2K-row halo recomputed around each strip stays at most half its height
+    return max(4 * K, min(STRIP_ROWS, (N + W - 1) // W))
+
+# U and V are stored interleaved as UV[..., 0] and UV[..., 1] so each cell is one load
+
+# The CPU kernels below are plain functions so build_rd.py can compile them ahead of time;
+# they are JIT-compiled at import only when that prebuilt module is missing.
+KERNEL_OPTIONS = dict(parallel=True, fastmath=True, boundscheck=False, nogil=True, error_model='numpy')
+# step_batch is called from the Tk thread while step_k runs on the simulation thread, and
+# Numba's workqueue threading layer aborts on concurrent parallel launches; the sweep's
+# small grids gain little from threads, so it is compiled serial
+SERIAL_KERNELS = {'step_batch'}
+
+def step(UV, UVn, params, ip1, im1):
+    N = UV.shape[0]
+    Du, Dv, f, k = params[0], params[1], params[2], params[3]
+    for ti in prange((N + BI - 1) // BI):
+        ii = ti * BI
+        for jj in range(0, N, BJ):
+            for i in range(ii, min(ii + BI, N)):
+                for j in range(jj, min(jj + BJ, N)):
+                    u = UV[i, j, 0]
+                    v = UV[i, j, 1]
+                    Lu = UV[im1[i], j, 0] + UV[ip1[i], j, 0] + UV[i, im1[j], 0] + UV[i, ip1[j], 0] - FOUR * u
+                    Lv = UV[im1[i], j, 1] + UV[ip1[i], j, 1] + UV[i, im1[j], 1] + UV[i, ip1[j], 1] - FOUR * v
+                    UVn[i, j, 0], UVn[i, j, 1] = gray_scott(u, v, Lu, Lv, Du, Dv, f, k)
+
+def step_k(UV, UVn, params, ip1, im1, K, W):
+    # Temporal blocking over full-width row strips: each strip is loaded with a
+    # halo of K rows, advanced K steps in per-thread scratch (the valid rows
+    # shrink by one per step) and only its own rows are written back. The
+    # worker count W is passed in; calling get_num_threads() here would keep
+    # the kernel out of the on-disk cache.
+    N = UV.shape[0]
+    Du, Dv, f, k = params[0], params[1], params[2], params[3]
+    SH = strip_height(N, K, W)
+    n_strips = (N + SH - 1) // SH
+    n_workers = min(W, n_strips)
+    for w in prange(n_workers):
+        tuv = np.empty((2, SH + 2 * K, N, 2), dtype=np.float32)
+        for strip in range(w, n_strips, n_workers):
+            ii = strip * SH
+            bi = min(SH, N - ii)
+            H = bi + 2 * K
+            for i in range(H):
+                gi = (ii + i - K) % N
+                for j in range(N):
+                    tuv[0, i, j, 0] = UV[gi, j, 0]
+                    tuv[0, i, j, 1] = UV[gi, j, 1]
+            for s in range(K):
+                src = s % 2
+                dst = 1 - src
+                for i in range(s + 1, H - s - 1):
+                    for j in range(N):
+                        u = tuv[src, i, j, 0]
+                        v = tuv[src, i, j, 1]
+                        Lu = tuv[src, i - 1, j, 0] + tuv[src, i + 1, j, 0] + tuv[src, i, im1[j], 0] + tuv[src, i, ip1[j], 0] - FOUR * u
+                        Lv = tuv[src, i - 1, j, 1] + tuv[src, i + 1, j, 1] + tuv[src, i, im1[j], 1] + tuv[src, i, ip1[j], 1] - FOUR * v
+                        tuv[dst, i, j, 0], tuv[dst, i, j, 1] = gray_scott(u, v, Lu, Lv, Du, Dv, f, k)
+            res = K % 2
+            for i in range(bi):
+                for j in range(N):
+                    UVn[ii + i, j, 0] = tuv[res, K + i, j, 0]
+                    UVn[ii + i, j, 1] = tuv[res, K + i, j, 1]
+
+def react(UV, Lu, Lv, UVn, params):
+    N = UV.shape[0]
+    Du, Dv, f, k = params[0], params[1], params[2], params[3]
+    for i in prange(N):
+        for j in range(N):
+            UVn[i, j, 0], UVn[i, j, 1] = gray_scott(UV[i, j, 0], UV[i, j, 1], Lu[i, j], Lv[i, j], Du, Dv, f, k)
+
+def step_batch(UV, UVn, Du, Dv, f, k, ip1, im1):
+    # Advance B independent grids, each with its own parameter set
+    B = UV.shape[0]
+    N = UV.shape[1]
+    for b in range(B):
+        for i in range(N):
+            for j in range(N):
+                u = UV[b, i, j, 0]
+                v = UV[b, i, j, 1]
+                Lu = UV[b, im1[i], j, 0] + UV[b, ip1[i], j, 0] + UV[b, i, im1[j], 0] + UV[b, i, ip1[j], 0] - FOUR * u
+                Lv = UV[b, im1[i], j, 1] + UV[b, ip1[i], j, 1] + UV[b, i, im1[j], 1] + UV[b, i, ip1[j], 1] - FOUR * v
+                UVn[b, i, j, 0], UVn[b, i, j, 1] = gray_scott(u, v, Lu, Lv, Du[b], Dv[b], f[b], k[b])
+
+KERNELS = {
+    'step': (step, 'void(f4[:,:,::1],f4[:,:,::1],f4[::1],i4[::1],i4[::1])'),
+    'step_k': (step_k, 'void(f4[:,:,::1],f4[:,:,::1],f4[::1],i4[::1],i4[::1],i8,i8)'),
+    'react': (react, 'void(f4[:,:,::1],f4[:,::1],f4[:,::1],f4[:,:,::1],f4[::1])'),
+    'step_batch': (step_batch, 'void(f4[:,:,:,::1],f4[:,:,:,::1],f4[::1],f4[::1],f4[::1],f4[::1],i4[::1],i4[::1])'),
+}
+
+try:
+    from rd_kernel import step, step_k, react, step_batch
+    # Ahead-of-time kernels run on the calling thread only
+    PARALLEL_KERNELS = False
+except ImportError:
+    # cache=True persists the compiled kernels under __pycache__ across runs
+    step, step_k, react, step_batch = (njit(sig, cache=True, **dict(KERNEL_OPTIONS, parallel=name not in SERIAL_KERNELS))(func)
+                                       for name, (func, sig) in KERNELS.items())
+    PARALLEL_KERNELS = True
+
+def specialize_step_k(N, Du, Dv, f, k):
+    # Regenerate step_k with the grid size and parameters baked in as constants,
+    # so LLVM can fold the modulo wrap and the coefficient arithmetic
+    func, sig = KERNELS['step_k']
+    constants = {
+        'N = UV.shape[0]': f'N = {N}',
+        'Du, Dv, f, k = params[0], params[1], params[2], params[3]':
+            f'Du, Dv, f, k = np.float32({Du!r}), np.float32({Dv!r}), np.float32({f!r}), np.float32({k!r})',
+    }
+    lines = inspect.getsource(func).splitlines()
+    lines[0] = lines[0].replace('def step_k(', 'def step_k_specialized(')
+    replaced = set()
+    for n, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped in constants:
+            lines[n] = line[:len(line) - len(line.lstrip())] + constants[stripped]
+            replaced.add(stripped)
+    assert replaced == set(constants), "step_k no longer matches the lines specialize_step_k rewrites"
+    # Generated from a string, so unlike the module-level kernels this one cannot be cached on disk
+    namespace = dict(globals())
+    exec('\n'.join(lines), namespace)
+    return njit(sig, **KERNEL_OPTIONS)(namespace['step_k_specialized'])
+
+gray_scott_gpu = cuda.jit(device=True)(gray_scott.py_func)
+
+@cuda.jit(fastmath=True, cache=True)
+def rd_step_gpu(dUV, dUVn, Du, Dv, f, k):
+    suv = cuda.shared.array((GPU_BLOCK + 2, GPU_BLOCK + 2, 2), dtype=float32)
+    N = dUV.shape[0]
+    tx = cuda.threadIdx.x
+    ty = cuda.threadIdx.y
+    i0 = cuda.blockIdx.y * GPU_BLOCK
+    j0 = cuda.blockIdx.x * GPU_BLOCK
+
+    # Cooperatively load the block plus a one-cell periodic halo
+    for li in range(ty, GPU_BLOCK + 2, GPU_BLOCK):
+        gi = (i0 + li - 1) % N
+        for lj in range(tx, GPU_BLOCK + 2, GPU_BLOCK):
+            gj = (j0 + lj - 1) % N
+            suv[li, lj, 0] = dUV[gi, gj, 0]
+            suv[li, lj, 1] = dUV[gi, gj, 1]
+    cuda.syncthreads()
+
+    i = i0 + ty
+    j = j0 + tx
+    if i < N and j < N:
+        li = ty + 1
+        lj = tx + 1
+        u = suv[li, lj, 0]
+        v = suv[li, lj, 1]
+        Lu = suv[li - 1, lj, 0] + suv[li + 1, lj, 0] + suv[li, lj - 1, 0] + suv[li, lj + 1, 0] - FOUR * u
+        Lv = suv[li - 1, lj, 1] + suv[li + 1, lj, 1] + suv[li, lj - 1, 1] + suv[li, lj + 1, 1] - FOUR * v
+        dUVn[i, j, 0], dUVn[i, j, 1] = gray_scott_gpu(u, v, Lu, Lv, Du, Dv, f, k)
+
+def initial_state(rng, N):
+    UV = np.empty((N, N, 2), dtype=np.float32)
+    UV[..., 0] = rng.uniform(0.5, 1.0, (N, N))
+    UV[..., 1] = rng.uniform(0.0, 0.2, (N, N))
+    # Splat ten 6x6 seed blobs in one advanced-indexing write
+    xy = rng.integers(3, N - 3, size=(10, 2))
+    offsets = np.arange(-3, 3)
+    rows = xy[:, 0, None, None] + offsets[None, :, None]
+    cols = xy[:, 1, None, None] + offsets[None, None, :]
+    UV[rows, cols] = (0.5, 0.25)
+    return UV
+
+def periodic_neighbours(N):
+    # Periodic +/-1 neighbour lookup tables, so the stencil does no index arithmetic
+    idx = np.arange(N, dtype=np.int32)
+    return np.roll(idx, -1), np.roll(idx, 1)
+
+def param_property(index):
+    # Exposes one slot of ReactionDiffusionSystem.params as a float attribute
+    def getter(self):
+        return float(self.params[index])
+
+    def setter(self, value):
+        self.params[index] = value
+    return property(getter, setter)
 
 class ReactionDiffusionSystem:
-    def __init__(self, size=200, Du=0.16, Dv=0.08, f=0.035, k=0.065):
+    Du = param_property(0)
+    Dv = param_property(1)
+    f = param_property(2)
+    k = param_property(3)
+
+    def __init__(self, size=200, Du=0.16, Dv=0.08, f=0.035, k=0.065, use_gpu=CUDA_AVAILABLE, use_fft=False, seed=None):
         self.size = size
-        self.Du = Du
-        self.Dv = Dv
-        self.f = f
-        self.k = k
+        self._rng = np.random.default_rng(seed)
+        self._kernels = {}
+        self._pending_key = None
+        self._pending_since = 0.0
+        self._compiling = None
+        self.use_gpu = use_gpu
+        self.use_fft = use_fft
+        self.params = np.array([Du, Dv, f, k], dtype=np.float32)
         self.reset()
 
+    @property
+    def U(self):
+        return self.UV[..., 0]
+
+    @property
+    def V(self):
+        return self.UV[..., 1]
+
     def reset(self):
-        self.U = np.random.uniform(0.5, 1.0, (self.size, self.size))
-        self.V = np.random.uniform(0.0, 0.2, (self.size, self.size))
-        for _ in range(10):
-            x, y = np.random.randint(0, self.size, 2)
-            self.U[x-3:x+3, y-3:y+3] = 0.5
-            self.V[x-3:x+3, y-3:y+3] = 0.25
+        self.UV = initial_state(self._rng, self.size)
+        self._allocate()
+
+    def set_state(self, U, V):
+        self.UV = np.stack((U, V), axis=-1).astype(np.float32)
+        self.size = self.UV.shape[0]
+        self._allocate()
+
+    def _allocate(self):
+        self.UV_next = np.empty_like(self.UV)
+        self.ip1, self.im1 = periodic_neighbours(self.size)
+        self._device = None
+        self.K_hat = None
+        if self.use_fft and self.size >= FFT_MIN_SIZE:
+            kernel = np.zeros((self.size, self.size), dtype=np.float32)
+            kernel[0, 0] = -4
+            kernel[1, 0] = kernel[-1, 0] = kernel[0, 1] = kernel[0, -1] = 1
+            # The 5-point kernel is symmetric, so its spectrum is real
+            self.K_hat = fft.rfft2(kernel).real.astype(np.float32)
 
     def update(self):
-        self.U, self.V = update_jit(self.U, self.V, self.Du, self.Dv, self.f, self.k)
+        step(self.UV, self.UV_next, self.params, self.ip1, self.im1)
+        self.UV, self.UV_next = self.UV_next, self.UV
+        self._device = None
+
+    def update_k(self, K):
+        if self.use_gpu:
+            self.update_k_gpu(K)
+            return
+        if self.K_hat is not None:
+            self.update_k_fft(K)
+            return
+        W = get_num_threads() if PARALLEL_KERNELS else 1
+        SH = strip_height(self.size, K, W)
+        if (self.size + SH - 1) // SH < W:
+            # Too few strips to occupy every worker; step's tile rows need no halo,
+            # so K plain steps keep at least as many threads busy
+            for _ in range(K):
+                self.update()
+            return
+        kernel = self.specialized_step_k()
+        (kernel or step_k)(self.UV, self.UV_next, self.params, self.ip1, self.im1, K, W)
+        self.UV, self.UV_next = self.UV_next, self.UV
+
+    def specialized_step_k(self):
+        # Once the parameters have been left alone for SPECIALIZE_IDLE, compile a
+        # specialised kernel on a worker thread; the generic kernel keeps running
+        # until it is ready
+        if self.size < SPECIALIZE_MIN_SIZE:
+            return None
+        key = (self.size, *self.params.tolist())
+        # A single lookup; the compile thread may clear the cache between two
+        kernel = self._kernels.get(key, MISSING)
+        if kernel is not MISSING:
+            return kernel
+        now = time.perf_counter()
+        if key != self._pending_key:
+            self._pending_key = key
+            self._pending_since = now
+        elif self._compiling is None and now - self._pending_since >= SPECIALIZE_IDLE:
+            self._compiling = key
+            threading.Thread(target=self._compile_specialized, args=(key,), daemon=True).start()
+        return None
+
+    def _compile_specialized(self, key):
+        kernel = None
+        try:
+            kernel = specialize_step_k(*key)
+        except OSError:
+            # Source is unavailable (e.g. a frozen build); stay on the generic kernel
+            pass
+        finally:
+            if len(self._kernels) >= SPECIALIZE_CACHE_SIZE:
+                self._kernels.clear()
+            self._kernels[key] = kernel
+            self._compiling = None
+
+    def laplacian_fft(self, Z):
+        L = fft.irfft2(fft.rfft2(Z, **FFT_WORKERS) * self.K_hat, s=Z.shape, **FFT_WORKERS)
+        return np.ascontiguousarray(L, dtype=np.float32)
+
+    def update_k_fft(self, K):
+        for _ in range(K):
+            Lu = self.laplacian_fft(self.U)
+            Lv = self.laplacian_fft(self.V)
+            react(self.UV, Lu, Lv, self.UV_next, self.params)
+            self.UV, self.UV_next = self.UV_next, self.UV
+
+    def update_k_gpu(self, K):
+        # State stays resident on the device between calls; only the result is copied back
+        if self._device is None:
+            self._device = [cuda.to_device(self.UV), cuda.device_array_like(self.UV)]
+        dUV, dUVn = self._device
+        N = self.UV.shape[0]
+        blocks = ((N + GPU_BLOCK - 1) // GPU_BLOCK, (N + GPU_BLOCK - 1) // GPU_BLOCK)
+        threads = (GPU_BLOCK, GPU_BLOCK)
+        Du, Dv, f, k = self.params
+        for _ in range(K):
+            rd_step_gpu[blocks, threads](dUV, dUVn, Du, Dv, f, k)
+            dUV, dUVn = dUVn, dUV
+        self._device = [dUV, dUVn]
+        dUV.copy_to_host(self.UV)
+
+class ParameterSweep:
+    def __init__(self, params, size=SWEEP_SIZE, seed=None):
+        self.size = size
+        self.params = params
+        self._rng = np.random.default_rng(seed)
+        self.Du, self.Dv, self.f, self.k = (np.array(p, dtype=np.float32) for p in zip(*params))
+        self.UV = np.stack([initial_state(self._rng, size) for _ in params])
+        self.UV_next = np.empty_like(self.UV)
+        self.ip1, self.im1 = periodic_neighbours(size)
+
+    @property
+    def U(self):
+        return self.UV[..., 0]
+
+    def update(self, steps=1):
+        for _ in range(steps):
+            step_batch(self.UV, self.UV_next, self.Du, self.Dv, self.f, self.k, self.ip1, self.im1)
+            self.UV, self.UV_next = self.UV_next, self.UV
 
 class App(tk.Tk):
     def __init__(self):
@@ -73,8 +403,44 @@ class App(tk.Tk):
         self.geometry("1300x800")
 
         self.rd_system = ReactionDiffusionSystem()
+        self._sim_lock = threading.Lock()
+        self._frame_lock = threading.Lock()
+        self._display_stride = max(1, self.rd_system.size // DISPLAY_MAX)
+        self.U_back = self._display_view().copy()
+        self.U_display = self.U_back.copy()
+        self._frame_dirty = False
+        self._substeps = 20
+        self._target_ms = 30.0
         self.setup_ui()
 
+        self._sim_thread = threading.Thread(target=self._sim_loop, daemon=True)
+        self._sim_thread.start()
+
+    def _sim_loop(self):
+        # The JIT kernels run without the GIL, so stepping here leaves the Tk thread free
+        while True:
+            with self._sim_lock:
+                t0 = time.perf_counter()
+                self.rd_system.update_k(self._substeps)
+                dt = max((time.perf_counter() - t0) * 1000, 1e-3)
+                # Scale the sub-step count so each published frame costs about _target_ms,
+                # by at most a factor of two per frame since cost is not linear in K
+                n = self._substeps
+                n = min(max(int(n * self._target_ms / dt), n // 2), n * 2)
+                self._substeps = max(1, min(MAX_SUBSTEPS, n))
+                U = self._display_view()
+                with self._frame_lock:
+                    if self.U_back.shape != U.shape:
+                        self.U_back = np.empty_like(U)
+                    np.copyto(self.U_back, U)
+                    self._frame_dirty = True
+            # Yield so reset/save/load waiting on the Tk thread can take the lock
+            time.sleep(0)
+
+    def _display_view(self):
+        s = self._display_stride
+        return self.rd_system.U[::s, ::s]
+
     def setup_ui(self):
         self.fig, (self.ax, self.ax_params) = plt.subplots(2, 1, figsize=(8, 10), gridspec_kw={'height_ratios': [3, 1]})
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
@@ -82,20 +448,25 @@ class App(tk.Tk):
         self.canvas_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=1)
         plt.close(self.fig)  # Close the figure to prevent a separate window from opening
 
-        self.im = self.ax.imshow(self.rd_system.U, cmap='viridis', animated=True, vmin=0, vmax=1)
+        self._norm = Normalize(0, 1)
+        self.im = self.ax.imshow(self.U_display, cmap='viridis', animated=True, norm=self._norm)
         self.fig.colorbar(self.im, ax=self.ax)
         self.ax.set_title("Reaction-Diffusion Pattern")
 
+        # Start from the initial values so the plot does not show a step up from zero
+        self._hist = np.tile(self.rd_system.params[:, None], 100)
+        self._hist_idx = 0
         self.param_lines = {}
-        for param in ['Du', 'Dv', 'f', 'k']:
-            self.param_lines[param], = self.ax_params.plot([], [], label=param)
+        for i, param in enumerate(['Du', 'Dv', 'f', 'k']):
+            self.param_lines[param], = self.ax_params.plot(np.arange(100), self._hist[i], label=param, animated=True)
         self.ax_params.legend()
+        # Fixed limits keep the blit background valid; the lines are redrawn on top each frame
         self.ax_params.set_xlim(0, 100)
         self.ax_params.set_ylim(0, 0.2)
+        self.ax_params.set_autoscale_on(False)
         self.ax_params.set_title("Parameter History")
         self.ax_params.set_xlabel("Time")
         self.ax_params.set_ylabel("Parameter Value")
-        self.param_history = {param: [] for param in ['Du', 'Dv', 'f', 'k']}
 
         control_frame = ttk.Frame(self)
         control_frame.pack(side=tk.RIGHT, fill=tk.Y)
@@ -134,23 +505,26 @@ class App(tk.Tk):
         ttk.Button(control_frame, text="Reset Simulation", command=self.reset).pack(pady=5)
         ttk.Button(control_frame, text="Save State", command=self.save_state).pack(pady=5)
         ttk.Button(control_frame, text="Load State", command=self.load_state).pack(pady=5)
+        ttk.Button(control_frame, text="Sweep", command=self.show_sweep).pack(pady=5)
         ttk.Button(control_frame, text="Help", command=self.show_help).pack(pady=5)
 
-        self.animation = FuncAnimation(self.fig, self.update, frames=200, interval=50, blit=True)
+        self.animation = FuncAnimation(self.fig, self.update, frames=200, interval=33, blit=True)
 
     def update(self, frame):
-        for _ in range(20):
-            self.rd_system.update()
-        self.im.set_array(self.rd_system.U)
-
-        for param in ['Du', 'Dv', 'f', 'k']:
-            self.param_history[param].append(getattr(self.rd_system, param))
-            if len(self.param_history[param]) > 100:
-                self.param_history[param].pop(0)
-            self.param_lines[param].set_data(range(len(self.param_history[param])), self.param_history[param])
+        # Only push a new image through the colormap when the simulation produced one
+        if self._frame_dirty:
+            with self._frame_lock:
+                if self.U_display.shape != self.U_back.shape:
+                    self.U_display = np.empty_like(self.U_back)
+                np.copyto(self.U_display, self.U_back)
+                self._frame_dirty = False
+            self.im.set_data(self.U_display)
 
-        self.ax_params.relim()
-        self.ax_params.autoscale_view()
+        rd = self.rd_system
+        self._hist[:, self._hist_idx % 100] = (rd.Du, rd.Dv, rd.f, rd.k)
+        self._hist_idx += 1
+        for i, param in enumerate(['Du', 'Dv', 'f', 'k']):
+            self.param_lines[param].set_ydata(np.roll(self._hist[i], -self._hist_idx))
 
         return [self.im] + list(self.param_lines.values())
 
@@ -169,7 +543,8 @@ class App(tk.Tk):
         self.im.set_cmap(self.cmap_var.get())
 
     def reset(self):
-        self.rd_system.reset()
+        with self._sim_lock:
+            self.rd_system.reset()
         initial_values = {'Du': 0.16, 'Dv': 0.08, 'f': 0.035, 'k': 0.065}
         for param, initial in initial_values.items():
             self.param_vars[param].set(initial)
@@ -177,32 +552,68 @@ class App(tk.Tk):
             self.value_labels[param].config(text=f"{initial:.4f}")
 
     def save_state(self):
-        state = {
-            'U': self.rd_system.U.tolist(),
-            'V': self.rd_system.V.tolist(),
-            'Du': self.rd_system.Du,
-            'Dv': self.rd_system.Dv,
-            'f': self.rd_system.f,
-            'k': self.rd_system.k
-        }
-        with open('rd_state.json', 'w') as f:
-            json.dump(state, f)
+        rd = self.rd_system
+        with self._sim_lock:
+            np.savez_compressed('rd_state.npz', U=rd.U, V=rd.V,
+                                params=np.array([rd.Du, rd.Dv, rd.f, rd.k], dtype=np.float64))
         messagebox.showinfo("Save State", "Simulation state saved successfully!")
 
     def load_state(self):
         try:
-            with open('rd_state.json', 'r') as f:
-                state = json.load(f)
-            self.rd_system.U = np.array(state['U'])
-            self.rd_system.V = np.array(state['V'])
-            for param in ['Du', 'Dv', 'f', 'k']:
-                value = state[param]
-                setattr(self.rd_system, param, value)
-                self.param_vars[param].set(value)
-                self.value_labels[param].config(text=f"{value:.4f}")
-            messagebox.showinfo("Load State", "Simulation state loaded successfully!")
+            with np.load('rd_state.npz') as data:
+                U, V = data['U'], data['V']
+                params = dict(zip(['Du', 'Dv', 'f', 'k'], data['params'].tolist()))
         except FileNotFoundError:
-            messagebox.showerror("Error", "No saved state found.")
+            # Fall back to the JSON format written by older versions
+            try:
+                with open('rd_state.json', 'r') as f:
+                    state = json.load(f)
+            except FileNotFoundError:
+                messagebox.showerror("Error", "No saved state found.")
+                return
+            U, V = np.array(state['U']), np.array(state['V'])
+            params = {param: state[param] for param in ['Du', 'Dv', 'f', 'k']}
+        with self._sim_lock:
+            self.rd_system.set_state(U, V)
+            self._display_stride = max(1, self.rd_system.size // DISPLAY_MAX)
+        for param, value in params.items():
+            setattr(self.rd_system, param, value)
+            self.param_vars[param].set(value)
+            self.value_labels[param].config(text=f"{value:.4f}")
+        messagebox.showinfo("Load State", "Simulation state loaded successfully!")
+
+    def show_sweep(self):
+        # 3x3 grid of thumbnails around the current f (rows) and k (columns)
+        rd = self.rd_system
+        fs = [max(0.001, min(0.2, rd.f + d)) for d in (-0.005, 0.0, 0.005)]
+        ks = [max(0.001, min(0.2, rd.k + d)) for d in (-0.002, 0.0, 0.002)]
+        sweep = ParameterSweep([(rd.Du, rd.Dv, f, k) for f in fs for k in ks])
+
+        window = tk.Toplevel(self)
+        window.title("Parameter Sweep")
+        fig, axes = plt.subplots(3, 3, figsize=(8, 8))
+        canvas = FigureCanvasTkAgg(fig, master=window)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=1)
+        plt.close(fig)
+
+        images = []
+        for ax, U, (Du, Dv, f, k) in zip(axes.flat, sweep.U, sweep.params):
+            images.append(ax.imshow(U, cmap=self.cmap_var.get(), animated=True, norm=self._norm))
+            ax.set_title(f"f={f:.4f} k={k:.4f}", fontsize=9)
+            ax.axis('off')
+
+        def update(frame):
+            sweep.update(SWEEP_SUBSTEPS)
+            for im, U in zip(images, sweep.U):
+                im.set_data(U)
+            return images
+
+        animation = FuncAnimation(fig, update, frames=200, interval=50, blit=True)
+
+        def close():
+            animation.event_source.stop()
+            window.destroy()
+        window.protocol("WM_DELETE_WINDOW", close)
 
     def show_help(self):
         help_text = """
@@ -218,6 +629,7 @@ class App(tk.Tk):
         4. Use +/- buttons for fine-tuning parameters.
         5. Change the color map using the dropdown menu.
         6. Use the buttons to reset the simulation, save/load states, or view this help.
+        7. Sweep opens a grid of simulations around the current f and k values.
 
         Experiment with different parameter values to create various patterns!
         Adjust parameters slowly to avoid pattern collapse.
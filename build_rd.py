@@ -0,0 +1,37 @@
+"""Compile the CPU stencil kernels into the rd_kernel extension module.
+
+Run ``python build_rd.py`` once next to the simulator script. The simulator
+imports rd_kernel when it is present and falls back to JIT compilation
+otherwise. Ahead-of-time code runs single-threaded and holds the GIL, so
+this trades the parallel JIT kernels, and a UI that keeps responding while
+the background thread steps, for near-instant startup.
+"""
+import importlib.util
+import os
+import tempfile
+
+from numba import config
+from numba.pycc import CC
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(HERE, "Dynamical Reaction Difussion Pattern.py")
+
+
+def load_kernels():
+    spec = importlib.util.spec_from_file_location("rd_app", APP)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.KERNELS
+
+
+if __name__ == "__main__":
+    # Importing the simulator JIT-compiles its fallback kernels; keep those cache entries
+    # out of the simulator's own __pycache__, where they would be recorded under this
+    # script's module name rather than the simulator's, and remove them afterwards.
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config.CACHE_DIR = cache_dir
+        cc = CC('rd_kernel')
+        cc.output_dir = HERE
+        for name, (func, sig) in load_kernels().items():
+            cc.export(name, sig)(func)
+        cc.compile()